@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from clp_py_utils.clp_config import ArchiveOutput, StorageType
@@ -7,6 +8,9 @@ from clp_py_utils.clp_config import ArchiveOutput, StorageType
 # Constants
 MYSQL_TABLE_NAME_MAX_LEN = 64
 
+# Max number of archive IDs to reference in a single statement
+ARCHIVE_IDS_BATCH_SIZE_MAX = 1000
+
 ARCHIVES_TABLE_SUFFIX = "archives"
 COLUMN_METADATA_TABLE_SUFFIX = "column_metadata"
 DATASETS_TABLE_SUFFIX = "datasets"
@@ -73,6 +77,9 @@ def _create_column_metadata_table(db_cursor, table_prefix: str, dataset: str) ->
     )
 
 
+# Table names are derived from a small, fixed set of prefixes, suffixes, and datasets, so they're
+# cached rather than rebuilt for every metadata query.
+@functools.lru_cache(maxsize=256)
 def _get_table_name(prefix: str, suffix: str, dataset: str | None) -> str:
     """
     :param prefix:
@@ -182,31 +189,40 @@ def delete_archives_from_metadata_db(
     Deletes archives from the metadata database specified by a list of IDs. It also deletes
     the associated entries from the `files` table that reference these archives.
 
-    The order of deletion follows the foreign key constraints, ensuring no violations occur during
-    the process.
+    Each batch of archives and their `files` entries is deleted with a single multi-table `DELETE`
+    statement, rather than one statement per table.
+
+    To keep statements bounded in size, archives are deleted in batches of at most
+    `ARCHIVE_IDS_BATCH_SIZE_MAX` IDs. All batches are executed in the cursor's current transaction,
+    so the caller is responsible for committing or rolling back the deletion.
 
     :param db_cursor:
     :param archive_ids: The list of archive to delete.
     :param table_prefix:
     :param dataset:
     """
-    ids_list_string = ", ".join(["%s"] * len(archive_ids))
+    files_table_name = get_files_table_name(table_prefix, dataset)
+    archives_table_name = get_archives_table_name(table_prefix, dataset)
 
-    db_cursor.execute(
-        f"""
-        DELETE FROM `{get_files_table_name(table_prefix, dataset)}`
-        WHERE archive_id in ({ids_list_string})
-        """,
-        archive_ids,
-    )
+    # Every batch except possibly the last has the same size, so the query only needs to be rebuilt
+    # when the batch size changes.
+    query_batch_size = 0
+    delete_query = ""
+    for batch_start_idx in range(0, len(archive_ids), ARCHIVE_IDS_BATCH_SIZE_MAX):
+        archive_ids_batch = archive_ids[
+            batch_start_idx : batch_start_idx + ARCHIVE_IDS_BATCH_SIZE_MAX
+        ]
+        if len(archive_ids_batch) != query_batch_size:
+            query_batch_size = len(archive_ids_batch)
+            ids_list_string = ", ".join(["%s"] * query_batch_size)
+            delete_query = f"""
+                DELETE archives, files
+                FROM `{archives_table_name}` AS archives
+                LEFT JOIN `{files_table_name}` AS files ON files.archive_id = archives.id
+                WHERE archives.id in ({ids_list_string})
+                """
 
-    db_cursor.execute(
-        f"""
-        DELETE FROM `{get_archives_table_name(table_prefix, dataset)}`
-        WHERE id in ({ids_list_string})
-        """,
-        archive_ids,
-    )
+        db_cursor.execute(delete_query, archive_ids_batch)
 
 
 def delete_dataset_from_metadata_db(db_cursor, table_prefix: str, dataset: str) -> None:
@@ -217,15 +233,15 @@ def delete_dataset_from_metadata_db(db_cursor, table_prefix: str, dataset: str)
     :param table_prefix:
     :param dataset:
     """
-    # Drop tables in an order such that no foreign key constraint is violated.
+    # List tables in an order such that no foreign key constraint is violated, and drop them all
+    # in a single statement to avoid a round trip per table.
     tables_in_removal_order = [
         get_column_metadata_table_name(table_prefix, dataset),
         get_files_table_name(table_prefix, dataset),
         get_archives_table_name(table_prefix, dataset),
     ]
-
-    for table in tables_in_removal_order:
-        db_cursor.execute(f"DROP TABLE IF EXISTS `{table}`")
+    tables_list_string = ", ".join(f"`{table}`" for table in tables_in_removal_order)
+    db_cursor.execute(f"DROP TABLE IF EXISTS {tables_list_string}")
 
     # Remove the dataset row from the datasets table
     db_cursor.execute(
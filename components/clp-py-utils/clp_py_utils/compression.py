@@ -1,4 +1,5 @@
 import pathlib
+import stat
 
 import Levenshtein
 
@@ -98,9 +99,13 @@ def validate_path_and_get_info(required_parent_dir: pathlib.Path, path: pathlib.
     if not path.is_absolute():
         raise ValueError(f'"{path}" is not absolute.')
 
-    # Verify that path exists
-    if not path.exists():
-        raise ValueError(f'"{path}" does not exist.')
+    # Verify that path exists. The result is reused below so that each path is only stat-ed once.
+    # NOTE: Any path that can't be stat-ed (e.g., a symlink loop or a permission error) must be
+    # reported as an invalid path rather than propagating `OSError`.
+    try:
+        path_stat = path.stat()
+    except OSError as ex:
+        raise ValueError(f'"{path}" does not exist or can\'t be accessed: {ex.strerror}') from None
 
     # Verify that path points to a file/dir within required parent dir
     try:
@@ -116,12 +121,11 @@ def validate_path_and_get_info(required_parent_dir: pathlib.Path, path: pathlib.
         # Not within parent dir, so resolve it
         path = path.resolve()
 
-    if path.is_dir():
+    if stat.S_ISDIR(path_stat.st_mode):
         # Check if directory is empty
         if next(path.iterdir(), None) is None:
             empty_directory = str(path)
     else:
-        file_size = path.stat().st_size
-        file = FileMetadata(path, file_size)
+        file = FileMetadata(path, path_stat.st_size)
 
     return file, empty_directory
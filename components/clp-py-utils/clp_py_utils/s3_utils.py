@@ -6,6 +6,7 @@ from typing import Final
 
 import boto3
 import botocore
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from job_orchestration.scheduler.job_config import S3InputConfig
 
@@ -36,6 +37,11 @@ AWS_ENV_VAR_SESSION_TOKEN: Final[str] = "AWS_SESSION_TOKEN"
 
 S3_OBJECT_DELETION_BATCH_SIZE_MAX: Final[int] = 1000
 
+# Files at least this large are uploaded as parallel multipart uploads rather than a single PUT.
+S3_MULTIPART_UPLOAD_THRESHOLD: Final[int] = 8 * 1024 * 1024
+S3_MULTIPART_UPLOAD_PART_SIZE: Final[int] = 8 * 1024 * 1024
+S3_MULTIPART_UPLOAD_MAX_CONCURRENCY: Final[int] = 8
+
 SCHEME_REGEXP = r"(?P<scheme>(http|https))"
 S3_PREFIX_REGEXP = r"(?P<s3>s3)"
 ENDPOINT_REGEXP = r"(?P<endpoint>[a-z0-9.-]+(\:[0-9]+)?)"
@@ -315,35 +321,40 @@ def s3_get_object_metadata(s3_input_config: S3InputConfig) -> list[FileMetadata]
 
 def s3_put(s3_config: S3Config, src_file: Path, dest_path: str) -> None:
     """
-    Uploads a local file to an S3 bucket using AWS's PutObject operation.
+    Uploads a local file to an S3 bucket.
+
+    Files smaller than `S3_MULTIPART_UPLOAD_THRESHOLD` are uploaded using AWS's PutObject operation.
+    Larger files are split into `S3_MULTIPART_UPLOAD_PART_SIZE` parts which are uploaded in parallel
+    using a multipart upload. If a multipart upload fails, the upload is aborted, which requires the
+    `s3:AbortMultipartUpload` permission.
 
     :param s3_config: S3 configuration specifying the upload destination and credentials.
     :param src_file: Local file to upload.
     :param dest_path: The destination path for the uploaded file in the S3 bucket, relative to
     `s3_config.key_prefix` (the file's S3 key will be `s3_config.key_prefix` + `dest_path`).
-    :raises: ValueError if `src_file` doesn't exist, doesn't resolve to a file or is larger than the
-    S3 PutObject limit.
+    :raises: ValueError if `src_file` doesn't exist or doesn't resolve to a file.
     :raises: Propagates `boto3.client`'s exceptions.
-    :raises: Propagates `boto3.client.put_object`'s exceptions.
+    :raises: Propagates `boto3.client.upload_file`'s exceptions.
     """
     if not src_file.exists():
         raise ValueError(f"{src_file} doesn't exist")
     if not src_file.is_file():
         raise ValueError(f"{src_file} is not a file")
-    if src_file.stat().st_size > 5 * 1024 * 1024 * 1024:
-        raise ValueError(
-            f"{src_file} is larger than the limit (5GiB) for a single PutObject operation."
-        )
 
     boto3_config = Config(retries=dict(total_max_attempts=3, mode="adaptive"))
     s3_client = _create_s3_client(
         s3_config.endpoint_url, s3_config.region_code, s3_config.aws_authentication, boto3_config
     )
 
-    with open(src_file, "rb") as file_data:
-        s3_client.put_object(
-            Bucket=s3_config.bucket, Body=file_data, Key=s3_config.key_prefix + dest_path
-        )
+    transfer_config = TransferConfig(
+        multipart_threshold=S3_MULTIPART_UPLOAD_THRESHOLD,
+        multipart_chunksize=S3_MULTIPART_UPLOAD_PART_SIZE,
+        max_concurrency=S3_MULTIPART_UPLOAD_MAX_CONCURRENCY,
+        use_threads=True,
+    )
+    s3_client.upload_file(
+        str(src_file), s3_config.bucket, s3_config.key_prefix + dest_path, Config=transfer_config
+    )
 
 
 def s3_delete_by_key_prefix(
@@ -35,6 +35,36 @@ constexpr size_t cNumBitsInByte{8};
 [[nodiscard]] auto min_bytes_containing_bits(size_t num_bits) -> size_t {
     return (num_bits / cNumBitsInByte) + ((0 != (num_bits % cNumBitsInByte)) ? 1 : 0);
 }
+
+/**
+ * @param divisor
+ * @return The multiplier `fast_mod` needs to compute remainders of division by `divisor`.
+ */
+[[nodiscard]] auto compute_fast_mod_multiplier(uint64_t divisor) -> unsigned __int128 {
+    return (~static_cast<unsigned __int128>(0) / divisor) + 1;
+}
+
+/**
+ * Computes `dividend % divisor` using Lemire et al.'s direct remainder computation
+ * (https://arxiv.org/abs/1902.01961), which replaces the 64-bit division with three
+ * multiplications. The result is exact for all 64-bit dividends and non-zero divisors.
+ * @param dividend
+ * @param divisor
+ * @param multiplier The result of `compute_fast_mod_multiplier(divisor)`.
+ * @return `dividend % divisor`.
+ */
+[[nodiscard]] auto fast_mod(uint64_t dividend, uint64_t divisor, unsigned __int128 multiplier)
+        -> uint64_t {
+    constexpr int cNumBitsInUint64{64};
+    auto const fraction{multiplier * dividend};
+    // Compute the upper 64 bits of the 192-bit product `fraction * divisor`.
+    auto const lower_product{
+            (static_cast<unsigned __int128>(static_cast<uint64_t>(fraction)) * divisor)
+            >> cNumBitsInUint64
+    };
+    auto const upper_product{(fraction >> cNumBitsInUint64) * divisor};
+    return static_cast<uint64_t>((lower_product + upper_product) >> cNumBitsInUint64);
+}
 }  // namespace
 
 auto BloomFilter::create(size_t expected_num_elements, double false_positive_rate)
@@ -111,15 +141,22 @@ auto BloomFilter::add(std::string_view value) -> void {
     uint64_t const h1{hash64(m_hash_algorithm, value, cPrimaryHashSeed)};
     auto const h2{std::max<uint64_t>(hash64(m_hash_algorithm, value, cSecondaryHashSeed), 1ULL)};
     for (uint32_t i = 0; i < m_num_hash_functions; ++i) {
-        set_bit(static_cast<size_t>((h1 + i * h2) % m_bit_array_size));
+        set_bit(hash_to_bit_index(h1 + i * h2));
     }
 }
 
 auto BloomFilter::possibly_contains(std::string_view value) const -> bool {
     uint64_t const h1{hash64(m_hash_algorithm, value, cPrimaryHashSeed)};
+    // The first probe only depends on `h1`, so test it before computing `h2`. Most lookups are
+    // for values that aren't in the filter, and those usually fail this probe, which lets them
+    // skip the second hash.
+    if (false == test_bit(hash_to_bit_index(h1))) {
+        return false;
+    }
+
     auto const h2{std::max<uint64_t>(hash64(m_hash_algorithm, value, cSecondaryHashSeed), 1ULL)};
-    for (uint32_t i = 0; i < m_num_hash_functions; ++i) {
-        if (false == test_bit(static_cast<size_t>((h1 + i * h2) % m_bit_array_size))) {
+    for (uint32_t i = 1; i < m_num_hash_functions; ++i) {
+        if (false == test_bit(hash_to_bit_index(h1 + i * h2))) {
             return false;
         }
     }
@@ -181,10 +218,15 @@ BloomFilter::BloomFilter(
         ystdlib::containers::Array<uint8_t> bit_array
 )
         : m_bit_array_size{bit_array_size},
+          m_bit_index_multiplier{compute_fast_mod_multiplier(bit_array_size)},
           m_num_hash_functions{num_hash_functions},
           m_hash_algorithm{hash_algorithm},
           m_bit_array{std::move(bit_array)} {}
 
+auto BloomFilter::hash_to_bit_index(uint64_t hash) const -> size_t {
+    return static_cast<size_t>(fast_mod(hash, m_bit_array_size, m_bit_index_multiplier));
+}
+
 auto BloomFilter::set_bit(size_t bit_index) -> void {
     size_t const byte_index{bit_index / cNumBitsInByte};
     size_t const bit_offset{bit_index % cNumBitsInByte};
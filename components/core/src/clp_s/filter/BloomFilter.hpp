@@ -86,10 +86,21 @@ private:
             ystdlib::containers::Array<uint8_t> bit_array
     );
 
+    /**
+     * @param hash
+     * @return `hash % m_bit_array_size`, computed without a division instruction.
+     */
+    [[nodiscard]] auto hash_to_bit_index(uint64_t hash) const -> size_t;
+
     auto set_bit(size_t bit_index) -> void;
     [[nodiscard]] auto test_bit(size_t bit_index) const -> bool;
 
     size_t m_bit_array_size{0};
+    // Precomputed multiplier for reducing hashes modulo `m_bit_array_size` in `hash_to_bit_index`.
+    // NOTE: `unsigned __int128` is a GCC/Clang extension. If it's ever replaced for portability,
+    // `hash_to_bit_index` must still return exactly `hash % m_bit_array_size`, since the serialized
+    // bit array depends on it (see the serialization tests in test-clp_s-bloom_filter.cpp).
+    unsigned __int128 m_bit_index_multiplier{0};
     uint32_t m_num_hash_functions{0};
     HashAlgorithm m_hash_algorithm{HashAlgorithm::Xxh364};
     ystdlib::containers::Array<uint8_t> m_bit_array;
@@ -1,14 +1,24 @@
+#include <sys/types.h>
+
+#include <algorithm>
 #include <cmath>
 #include <cstddef>
 #include <cstdint>
 #include <string>
+#include <tuple>
 #include <utility>
+#include <vector>
 
 #include <catch2/catch_message.hpp>
 #include <catch2/catch_test_macros.hpp>
+#include <catch2/generators/catch_generators.hpp>
 
+#include <clp/BufferReader.hpp>
+#include <clp/ErrorCode.hpp>
+#include <clp/WriterInterface.hpp>
 #include <clp_s/filter/BloomFilter.hpp>
 #include <clp_s/filter/ErrorCode.hpp>
+#include <clp_s/filter/HashAlgorithm.hpp>
 
 namespace {
 constexpr size_t cInsertions{10'000};
@@ -16,6 +26,44 @@ constexpr size_t cQueries{10'000};
 constexpr double cFalsePositiveRate{0.001};
 constexpr double cBelowMinFalsePositiveRate{1e-7};
 
+// Serialization format constants pinned by the tests below.
+constexpr uint64_t cPrimaryHashSeed{0};
+constexpr uint64_t cSecondaryHashSeed{0x9e37'79b9'7f4a'7c15ULL};
+constexpr size_t cSerializedHeaderSize{
+        sizeof(uint8_t) + sizeof(uint32_t) + sizeof(uint64_t) + sizeof(uint64_t)
+};
+constexpr size_t cNumBitsInByte{8};
+
+/**
+ * Writer that appends everything written to an in-memory buffer.
+ */
+class BufferWriter : public clp::WriterInterface {
+public:
+    void write(char const* data, size_t data_length) override {
+        m_buffer.insert(m_buffer.end(), data, data + data_length);
+    }
+
+    void flush() override {}
+
+    auto try_seek_from_begin(size_t /*pos*/) -> clp::ErrorCode override {
+        return clp::ErrorCode_Unsupported;
+    }
+
+    auto try_seek_from_current(off_t /*offset*/) -> clp::ErrorCode override {
+        return clp::ErrorCode_Unsupported;
+    }
+
+    auto try_get_pos(size_t& pos) const -> clp::ErrorCode override {
+        pos = m_buffer.size();
+        return clp::ErrorCode_Success;
+    }
+
+    [[nodiscard]] auto get_buffer() const -> std::vector<char> const& { return m_buffer; }
+
+private:
+    std::vector<char> m_buffer;
+};
+
 [[nodiscard]] auto make_odd(uint64_t value) -> uint64_t {
     return (value * 2) + 1;
 }
@@ -23,6 +71,73 @@ constexpr double cBelowMinFalsePositiveRate{1e-7};
 [[nodiscard]] auto make_even(uint64_t value) -> uint64_t {
     return value * 2;
 }
+
+/**
+ * @param bit_array_size
+ * @return The number of bytes needed to store a bit array of `bit_array_size` bits.
+ */
+[[nodiscard]] auto get_num_bit_array_bytes(size_t bit_array_size) -> size_t {
+    return (bit_array_size + cNumBitsInByte - 1) / cNumBitsInByte;
+}
+
+/**
+ * Serializes an empty Bloom filter with the given parameters, so that tests can construct filters
+ * with an exact bit array size through `BloomFilter::try_read`.
+ * @param num_hash_functions
+ * @param bit_array_size
+ * @return The serialized filter.
+ */
+[[nodiscard]] auto serialize_empty_filter(uint32_t num_hash_functions, uint64_t bit_array_size)
+        -> std::vector<char> {
+    BufferWriter writer;
+    writer.write_numeric_value(static_cast<uint8_t>(clp_s::filter::HashAlgorithm::Xxh364));
+    writer.write_numeric_value(num_hash_functions);
+    writer.write_numeric_value(bit_array_size);
+    auto const num_bytes{static_cast<uint64_t>(get_num_bit_array_bytes(bit_array_size))};
+    writer.write_numeric_value(num_bytes);
+    std::vector<char> const bit_array(num_bytes, 0);
+    writer.write(bit_array.data(), bit_array.size());
+    return writer.get_buffer();
+}
+
+/**
+ * Computes the bit array a Bloom filter should contain after adding `values`, reducing each hash
+ * to a bit index with a plain `%`.
+ * @param num_hash_functions
+ * @param bit_array_size
+ * @param values
+ * @return The expected bit array.
+ */
+[[nodiscard]] auto compute_expected_bit_array(
+        uint32_t num_hash_functions,
+        uint64_t bit_array_size,
+        std::vector<std::string> const& values
+) -> std::vector<char> {
+    std::vector<char> bit_array(get_num_bit_array_bytes(bit_array_size), 0);
+    for (auto const& value : values) {
+        auto const h1{clp_s::filter::hash64(
+                clp_s::filter::HashAlgorithm::Xxh364,
+                value,
+                cPrimaryHashSeed
+        )};
+        auto const h2{std::max<uint64_t>(
+                clp_s::filter::hash64(
+                        clp_s::filter::HashAlgorithm::Xxh364,
+                        value,
+                        cSecondaryHashSeed
+                ),
+                1ULL
+        )};
+        for (uint32_t i = 0; i < num_hash_functions; ++i) {
+            auto const bit_index{(h1 + i * h2) % bit_array_size};
+            auto& byte{bit_array.at(bit_index / cNumBitsInByte)};
+            byte = static_cast<char>(
+                    static_cast<uint8_t>(byte) | (1U << (bit_index % cNumBitsInByte))
+            );
+        }
+    }
+    return bit_array;
+}
 }  // namespace
 
 TEST_CASE("BloomFilter create rejects invalid false positive rates", "[clp_s][filter]") {
@@ -83,3 +198,58 @@ TEST_CASE("BloomFilter false positive rate is bounded", "[clp_s][filter]") {
     CAPTURE(false_positive_rate, allowed_false_positive_rate);
     REQUIRE(false_positive_rate <= allowed_false_positive_rate);
 }
+
+TEST_CASE("BloomFilter serializes bits at hash modulo bit array size", "[clp_s][filter]") {
+    using TestCase = std::tuple<uint32_t, uint64_t>;
+
+    auto const [num_hash_functions, bit_array_size] = GENERATE(
+            TestCase{1, 1},
+            TestCase{3, 1},
+            TestCase{4, 7},
+            TestCase{7, 64},
+            TestCase{5, 1000},
+            TestCase{10, 1'000'003},
+            TestCase{20, 8'388'609}
+    );
+    CAPTURE(num_hash_functions, bit_array_size);
+
+    auto const serialized_empty_filter{serialize_empty_filter(num_hash_functions, bit_array_size)};
+    clp::BufferReader reader{serialized_empty_filter.data(), serialized_empty_filter.size()};
+    auto filter_result{clp_s::filter::BloomFilter::try_read(reader)};
+    REQUIRE(false == filter_result.has_error());
+    auto filter{std::move(filter_result.value())};
+
+    std::vector<std::string> values;
+    for (size_t i = 0; i < 100; ++i) {
+        values.emplace_back(std::to_string(make_odd(i)));
+    }
+    values.emplace_back("");
+    values.emplace_back("The quick brown fox jumps over the lazy dog");
+    for (auto const& value : values) {
+        filter.add(value);
+    }
+
+    BufferWriter writer;
+    filter.write(writer);
+    auto const& serialized_filter{writer.get_buffer()};
+    REQUIRE(serialized_filter.size() == serialized_empty_filter.size());
+    REQUIRE(std::equal(
+            serialized_filter.begin(),
+            serialized_filter.begin() + cSerializedHeaderSize,
+            serialized_empty_filter.begin()
+    ));
+
+    auto const expected_bit_array{
+            compute_expected_bit_array(num_hash_functions, bit_array_size, values)
+    };
+    REQUIRE(std::equal(
+            serialized_filter.begin() + cSerializedHeaderSize,
+            serialized_filter.end(),
+            expected_bit_array.begin(),
+            expected_bit_array.end()
+    ));
+
+    for (auto const& value : values) {
+        REQUIRE(filter.possibly_contains(value));
+    }
+}